@@ -0,0 +1,199 @@
+"""kothon.utils.iter_utils"""
+
+from __future__ import annotations
+
+import array
+import functools
+import math
+import multiprocessing
+import operator
+import sys
+from collections import defaultdict, deque
+from itertools import chain, filterfalse, islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TypeVar
+
+from .numpy_utils import reduce_vector
+from .type_utils import CT
+
+T = TypeVar("T")
+Key = TypeVar("Key")
+
+_INDEXABLE = (list, tuple, str, bytes, range, array.array)
+_NOT_SUMMABLE = (str, bytes, bytearray)
+# sum() is a plain left fold before 3.12, later versions compensate float additions
+_SUM_IS_FOLD = sys.version_info < (3, 12)
+_MISSING = object()
+
+
+def key_in_parallel(
+    iterable: Iterable[T],
+    key_selector: Callable[[T], Key],
+    workers: int,
+) -> Iterator[tuple[Key, T]]:
+    """
+    Pairs each element of iterable with its key, evaluating key_selector in a pool of
+    worker processes. key_selector and the elements must be picklable. Raises
+    ValueError if workers is less than 1.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    values = list(iterable)
+    chunksize = max(1, len(values) // (workers * 4))
+    with multiprocessing.Pool(workers) as pool:
+        keys = pool.map(key_selector, values, chunksize=chunksize)
+    return zip(keys, values)
+
+
+def group_by(
+    iterable: Iterable[T],
+    key_selector: Callable[[T], Key],
+    workers: Optional[int] = None,
+) -> dict[Key, list[T]]:
+    """Groups the elements of iterable into lists keyed by key_selector."""
+    result: defaultdict[Key, list[T]] = defaultdict(list)
+    if workers is None:
+        for d in iterable:
+            result[key_selector(d)].append(d)
+    else:
+        for key, d in key_in_parallel(iterable, key_selector, workers):
+            result[key].append(d)
+    return dict(result)
+
+
+def all_match(iterable: Iterable[T], predicate: Callable[[T], Any]) -> bool:
+    """Returns True if predicate holds for every element, stopping at the first miss."""
+    return next(filterfalse(predicate, iterable), _MISSING) is _MISSING
+
+
+def any_match(iterable: Iterable[T], predicate: Callable[[T], Any]) -> bool:
+    """Returns True if predicate holds for some element, stopping at the first hit."""
+    return next(filter(predicate, iterable), _MISSING) is not _MISSING
+
+
+def max_by_or_none(iterable: Iterable[T], selector: Callable[[T], CT]) -> Optional[T]:
+    """Returns the first element with the largest selector value, or None."""
+    return max(iterable, key=selector, default=None)
+
+
+def min_by_or_none(iterable: Iterable[T], selector: Callable[[T], CT]) -> Optional[T]:
+    """Returns the first element with the smallest selector value, or None."""
+    return min(iterable, key=selector, default=None)
+
+
+def _head(iterable: Iterable[T]) -> Sequence[T]:
+    """Returns the first two elements of iterable, slicing it if it is indexable."""
+    if isinstance(iterable, _INDEXABLE):
+        return iterable[:2]
+    return list(islice(iterable, 2))
+
+
+def single(iterable: Iterable[T]) -> T:
+    """Returns the only element of iterable, raises ValueError otherwise."""
+    head = _head(iterable)
+    if len(head) == 0:
+        raise ValueError("single() called on an empty sequence")
+    if len(head) > 1:
+        raise ValueError("single() called on a sequence with more than one element")
+    return head[0]
+
+
+def single_or_none(iterable: Iterable[T]) -> Optional[T]:
+    """Returns the only element of iterable, or None."""
+    head = _head(iterable)
+    return head[0] if len(head) == 1 else None
+
+
+def first(iterable: Iterable[T]) -> T:
+    """Returns the first element of iterable, raises ValueError if it is empty."""
+    if isinstance(iterable, _INDEXABLE):
+        if not iterable:
+            raise ValueError("first() called on an empty sequence")
+        result: T = iterable[0]
+        return result
+
+    try:
+        return next(iter(iterable))
+    except StopIteration:
+        # pylint: disable=raise-missing-from
+        raise ValueError("first() called on an empty sequence")
+
+
+def first_or_none(iterable: Iterable[T]) -> Optional[T]:
+    """Returns the first element of iterable, or None if it is empty."""
+    if isinstance(iterable, _INDEXABLE):
+        if not iterable:
+            return None
+        result: T = iterable[0]
+        return result
+
+    return next(iter(iterable), None)
+
+
+def last(iterable: Iterable[T]) -> T:
+    """Returns the last element of iterable, raises ValueError if it is empty."""
+    if isinstance(iterable, _INDEXABLE):
+        if not iterable:
+            raise ValueError("last() called on an empty sequence")
+        result: T = iterable[-1]
+        return result
+
+    tail = deque(iterable, maxlen=1)
+    if not tail:
+        raise ValueError("last() called on an empty sequence")
+    return tail[0]
+
+
+def last_or_none(iterable: Iterable[T]) -> Optional[T]:
+    """Returns the last element of iterable, or None if it is empty."""
+    if isinstance(iterable, _INDEXABLE):
+        if not iterable:
+            return None
+        result: T = iterable[-1]
+        return result
+
+    tail = deque(iterable, maxlen=1)
+    return tail[0] if tail else None
+
+
+def _fold(accumulator: Any, rest: Iterator[Any], operation: Callable[..., Any]) -> Any:
+    """Folds rest into accumulator, using C-level builtins for common operations."""
+    summable = _SUM_IS_FOLD and not isinstance(accumulator, _NOT_SUMMABLE)
+    if operation is operator.add and summable:
+        return sum(rest, accumulator)
+    if operation is operator.mul:
+        return math.prod(rest, start=accumulator)
+    if operation is max or operation is min:
+        return operation(chain((accumulator,), rest))
+    return functools.reduce(operation, rest, accumulator)
+
+
+def reduce(iterable: Iterable[T], operation: Callable[[T, T], T]) -> T:
+    """Folds iterable from the left with operation, raises TypeError if it is empty."""
+    result: Optional[T] = reduce_vector(iterable, operation)
+    if result is not None:
+        return result
+    it = iter(iterable)
+    try:
+        accumulator = next(it)
+    except StopIteration:
+        # pylint: disable=raise-missing-from
+        raise TypeError("reduce() of empty iterable with no initial value")
+    folded: T = _fold(accumulator, it, operation)
+    return folded
+
+
+def reduce_or_none(
+    iterable: Iterable[T],
+    operation: Callable[[T, T], T],
+) -> Optional[T]:
+    """Folds iterable from the left with operation, or returns None if it is empty."""
+    result: Optional[T] = reduce_vector(iterable, operation)
+    if result is not None:
+        return result
+    it = iter(iterable)
+    try:
+        accumulator = next(it)
+    except StopIteration:
+        return None
+    folded: T = _fold(accumulator, it, operation)
+    return folded
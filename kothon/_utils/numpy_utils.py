@@ -0,0 +1,52 @@
+"""kothon.utils.numpy_utils"""
+
+from __future__ import annotations
+
+import operator
+import sys
+from typing import Any, Callable
+
+# (operation, ndarray method, dtype kinds for which the method matches a Python fold)
+# float sums stay on the fold: ndarray.sum adds pairwise and gives different results
+_REDUCTIONS: tuple[tuple[Callable[..., Any], str, str], ...] = (
+    (operator.add, "sum", "iu"),
+    (max, "max", "biu"),
+    (min, "min", "biu"),
+)
+
+
+def as_vector(obj: object) -> Any:
+    """
+    Returns obj if it is a non-empty one-dimensional numpy.ndarray, None otherwise.
+    Subclasses such as masked arrays are rejected: their methods follow other rules.
+
+    numpy is never imported here: if the caller has not imported it yet, obj cannot be
+    an ndarray and kothon stays free of the dependency.
+    """
+    numpy = sys.modules.get("numpy")
+    # pylint: disable=unidiomatic-typecheck
+    if numpy is None or type(obj) is not numpy.ndarray:
+        return None
+    vector: Any = obj
+    if vector.ndim != 1 or vector.size == 0:
+        return None
+    return vector
+
+
+def reduce_vector(obj: object, operation: Callable[..., Any]) -> Any:
+    """
+    Folds a non-empty one-dimensional numpy.ndarray with the array method equivalent to
+    operation. Returns None if obj is not such an array, or if there is no equivalent
+    for operation and the array's dtype (bool sums and float min/max with NaN differ).
+    """
+    for candidate, method, kinds in _REDUCTIONS:
+        if candidate is operation:
+            break
+    else:
+        return None
+    vector = as_vector(obj)
+    if vector is None or vector.dtype.kind not in kinds:
+        return None
+    if method == "sum":
+        return vector.sum(dtype=vector.dtype)
+    return getattr(vector, method)()
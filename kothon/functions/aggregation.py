@@ -1,7 +1,10 @@
 """kothon aggregation functions"""
 
+import operator
+from functools import partial
 from typing import Iterable, Optional, TypeVar, Callable, overload, Union
 
+from .._utils import iter_utils
 from .._utils.type_utils import CT, AT
 from ..iterable.seq import Seq
 
@@ -17,6 +20,8 @@ def to_list(sequence: Iterable[T]) -> list[T]:
     :param sequence: The sequence
     :return: A list containing all elements of the sequence.
     """
+    if isinstance(sequence, Seq):
+        return sequence.to_list()
     return list(sequence)
 
 
@@ -27,6 +32,8 @@ def to_set(sequence: Iterable[T]) -> set[T]:
     :param sequence: The sequence
     :return: A set containing all elements of the sequence.
     """
+    if isinstance(sequence, Seq):
+        return sequence.to_set()
     return set(sequence)
 
 
@@ -37,9 +44,18 @@ def to_frozenset(sequence: Iterable[T]) -> frozenset[T]:
     :param sequence: The sequence
     :return: A set containing all elements of the sequence.
     """
+    if isinstance(sequence, Seq):
+        return sequence.to_frozenset()
     return frozenset(sequence)
 
 
+def _associate(
+    fn: Callable[[T], tuple[Key, Value]],
+    sequence: Iterable[T],
+) -> dict[Key, Value]:
+    return dict(map(fn, sequence))
+
+
 @overload
 def associate(
     fn: Callable[[T], tuple[Key, Value]],
@@ -90,14 +106,26 @@ def associate(
     transformation of each element in the sequence.
     """
     if sequence is None:
-        return lambda s: Seq(s).associate(fn)
-    return Seq(sequence).associate(fn)
+        return partial(_associate, fn)
+    return _associate(fn, sequence)
+
+
+def _associate_by(
+    key_selector: Callable[[T], Key],
+    sequence: Iterable[T],
+    workers: Optional[int] = None,
+) -> dict[Key, T]:
+    if workers is not None:
+        return dict(iter_utils.key_in_parallel(sequence, key_selector, workers))
+    return {key_selector(d): d for d in sequence}
 
 
 @overload
 def associate_by(
     key_selector: Callable[[T], Key],
     sequence: Iterable[T],
+    *,
+    workers: Optional[int] = None,
 ) -> dict[Key, T]:
     """
     Creates a dictionary from the sequence by determining the keys using a specified
@@ -106,6 +134,8 @@ def associate_by(
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key that will be used as the key.
     :param sequence: The sequence
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: A dictionary where each key is the result of applying the key selector
     function to each element, and each value is the element itself.
     """
@@ -114,6 +144,8 @@ def associate_by(
 @overload
 def associate_by(
     key_selector: Callable[[T], Key],
+    *,
+    workers: Optional[int] = None,
 ) -> Callable[[Iterable[T]], dict[Key, T]]:
     """
     Builds a function that creates a dictionary from the sequence by determining the
@@ -122,6 +154,8 @@ def associate_by(
 
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key that will be used as the key.
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: Function that creates a dictionary from the sequence by determining the
     keys using a specified key selector function. The values in the dictionary are the
     elements themselves.
@@ -131,6 +165,8 @@ def associate_by(
 def associate_by(
     key_selector: Callable[[T], Key],
     sequence: Optional[Iterable[T]] = None,
+    *,
+    workers: Optional[int] = None,
 ) -> Union[dict[Key, T], Callable[[Iterable[T]], dict[Key, T]]]:
     """
     Creates a dictionary from the sequence by determining the keys using a specified
@@ -139,12 +175,21 @@ def associate_by(
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key that will be used as the key.
     :param sequence: The sequence. If None, a callable is returned.
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: A dictionary where each key is the result of applying the key selector
     function to each element, and each value is the element itself.
     """
     if sequence is None:
-        return lambda s: Seq(s).associate_by(key_selector)
-    return Seq(sequence).associate_by(key_selector)
+        return partial(_associate_by, key_selector, workers=workers)
+    return _associate_by(key_selector, sequence, workers)
+
+
+def _associate_with(
+    value_selector: Callable[[T], Value],
+    sequence: Iterable[T],
+) -> dict[T, Value]:
+    return {d: value_selector(d) for d in sequence}
 
 
 @overload
@@ -194,14 +239,16 @@ def associate_with(
     value is the result of applying the value selector function to that element.
     """
     if sequence is None:
-        return lambda s: Seq(s).associate_with(value_selector)
-    return Seq(sequence).associate_with(value_selector)
+        return partial(_associate_with, value_selector)
+    return _associate_with(value_selector, sequence)
 
 
 @overload
 def group_by(
     key_selector: Callable[[T], Key],
     sequence: Iterable[T],
+    *,
+    workers: Optional[int] = None,
 ) -> dict[Key, list[T]]:
     """
     Groups the elements of the sequence into a dictionary, with keys determined by
@@ -211,6 +258,8 @@ def group_by(
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key to be used as the key.
     :param sequence: The sequence
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: A dictionary where each key is the result of applying the key selector
     function to the elements, and each value is a list of elements that share the
     same key.
@@ -220,6 +269,8 @@ def group_by(
 @overload
 def group_by(
     key_selector: Callable[[T], Key],
+    *,
+    workers: Optional[int] = None,
 ) -> Callable[[Iterable[T]], dict[Key, list[T]]]:
     """
     Builds a function that groups the elements of the sequence into a dictionary, with
@@ -228,6 +279,8 @@ def group_by(
 
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key to be used as the key.
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: Function that groups the elements of the sequence into a dictionary, with
     keys determined by the specified key selector function. The values are lists
     containing all elements that correspond to each key.
@@ -237,6 +290,8 @@ def group_by(
 def group_by(
     key_selector: Callable[[T], Key],
     sequence: Optional[Iterable[T]] = None,
+    *,
+    workers: Optional[int] = None,
 ) -> Union[dict[Key, list[T]], Callable[[Iterable[T]], dict[Key, list[T]]]]:
     """
     Groups the elements of the sequence into a dictionary, with keys determined by
@@ -246,13 +301,23 @@ def group_by(
     :param key_selector: A function that takes an element of type T and returns a
     value of type Key to be used as the key.
     :param sequence: The sequence. If None, a callable is returned.
+    :param workers: If set, key_selector is evaluated in a pool of this many worker
+    processes (at least 1). key_selector and the elements must be picklable.
     :return: A dictionary where each key is the result of applying the key selector
     function to the elements, and each value is a list of elements that share the
     same key.
     """
     if sequence is None:
-        return lambda s: Seq(s).group_by(key_selector)
-    return Seq(sequence).group_by(key_selector)
+        return partial(
+            iter_utils.group_by,
+            key_selector=key_selector,
+            workers=workers,
+        )
+    return iter_utils.group_by(sequence, key_selector, workers)
+
+
+def _all_by(predicate: Callable[[T], bool], sequence: Iterable[T]) -> bool:
+    return iter_utils.all_match(sequence, predicate)
 
 
 @overload
@@ -296,8 +361,12 @@ def all_by(
     :return: True if all elements satisfy the condition, False otherwise.
     """
     if sequence is None:
-        return lambda s: Seq(s).all(predicate)
-    return Seq(sequence).all(predicate)
+        return partial(_all_by, predicate)
+    return _all_by(predicate, sequence)
+
+
+def _none_by(predicate: Callable[[T], bool], sequence: Iterable[T]) -> bool:
+    return not iter_utils.any_match(sequence, predicate)
 
 
 @overload
@@ -341,8 +410,12 @@ def none_by(
     :return: True if no elements satisfy the condition, False otherwise.
     """
     if sequence is None:
-        return lambda s: Seq(s).none(predicate)
-    return Seq(sequence).none(predicate)
+        return partial(_none_by, predicate)
+    return _none_by(predicate, sequence)
+
+
+def _any_by(predicate: Callable[[T], bool], sequence: Iterable[T]) -> bool:
+    return iter_utils.any_match(sequence, predicate)
 
 
 @overload
@@ -386,8 +459,8 @@ def any_by(
     :return: True if at least one element satisfies the condition, False otherwise.
     """
     if sequence is None:
-        return lambda s: Seq(s).any(predicate)
-    return Seq(sequence).any(predicate)
+        return partial(_any_by, predicate)
+    return _any_by(predicate, sequence)
 
 
 def max_or_none(sequence: Iterable[CT]) -> Optional[CT]:
@@ -397,31 +470,52 @@ def max_or_none(sequence: Iterable[CT]) -> Optional[CT]:
     :param sequence: The sequence
     :return: The maximum element or None if the sequence is empty.
     """
-    return Seq(sequence).max_or_none()
+    return iter_utils.reduce_or_none(sequence, max)
+
+
+def _max_by(
+    selector: Callable[[T], CT],
+    sequence: Iterable[T],
+    workers: Optional[int] = None,
+) -> T:
+    if workers is not None:
+        pairs = iter_utils.key_in_parallel(sequence, selector, workers)
+        return max(pairs, key=operator.itemgetter(0))[1]
+    return max(sequence, key=selector)
 
 
 @overload
 def max_by(
     selector: Callable[[T], CT],
     sequence: Iterable[T],
+    *,
+    workers: Optional[int] = None,
 ) -> T:
     """
     Returns an element for which the given function returns the largest value.
 
     :param selector: A function that returns a comparable value for each element.
     :param sequence: The sequence
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: The element that gives the maximum value from the given function.
     :raises ValueError: If the sequence is empty.
     """
 
 
 @overload
-def max_by(selector: Callable[[T], CT]) -> Callable[[Iterable[T]], T]:
+def max_by(
+    selector: Callable[[T], CT],
+    *,
+    workers: Optional[int] = None,
+) -> Callable[[Iterable[T]], T]:
     """
     Builds a function that returns an element for which the given function returns the
     largest value.
 
     :param selector: A function that returns a comparable value for each element.
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: Function that returns an element for which the given function returns the
     largest value.
     """
@@ -430,18 +524,22 @@ def max_by(selector: Callable[[T], CT]) -> Callable[[Iterable[T]], T]:
 def max_by(
     selector: Callable[[T], CT],
     sequence: Optional[Iterable[T]] = None,
+    *,
+    workers: Optional[int] = None,
 ) -> Union[T, Callable[[Iterable[T]], T]]:
     """
     Returns an element for which the given function returns the largest value.
 
     :param selector: A function that returns a comparable value for each element.
     :param sequence: The sequence. If None, a callable is returned.
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: The element that gives the maximum value from the given function.
     :raises ValueError: If the sequence is empty.
     """
     if sequence is None:
-        return lambda s: Seq(s).max_by(selector)
-    return Seq(sequence).max_by(selector)
+        return partial(_max_by, selector, workers=workers)
+    return _max_by(selector, sequence, workers)
 
 
 @overload
@@ -488,8 +586,8 @@ def max_by_or_none(
     None if the sequence is empty.
     """
     if sequence is None:
-        return lambda s: Seq(s).max_by_or_none(selector)
-    return Seq(sequence).max_by_or_none(selector)
+        return partial(iter_utils.max_by_or_none, selector=selector)
+    return iter_utils.max_by_or_none(sequence, selector)
 
 
 def min_or_none(sequence: Iterable[CT]) -> Optional[CT]:
@@ -499,31 +597,52 @@ def min_or_none(sequence: Iterable[CT]) -> Optional[CT]:
     :param sequence: The sequence
     :return: The minimum element or None if the sequence is empty.
     """
-    return Seq(sequence).min_or_none()
+    return iter_utils.reduce_or_none(sequence, min)
+
+
+def _min_by(
+    selector: Callable[[T], CT],
+    sequence: Iterable[T],
+    workers: Optional[int] = None,
+) -> T:
+    if workers is not None:
+        pairs = iter_utils.key_in_parallel(sequence, selector, workers)
+        return min(pairs, key=operator.itemgetter(0))[1]
+    return min(sequence, key=selector)
 
 
 @overload
 def min_by(
     selector: Callable[[T], CT],
     sequence: Iterable[T],
+    *,
+    workers: Optional[int] = None,
 ) -> T:
     """
     Returns an element for which the given function returns the smallest value.
 
     :param selector: A function that returns a comparable value for each element.
     :param sequence: The sequence
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: The element that gives the smallest value from the given function.
     :raises ValueError: If the sequence is empty.
     """
 
 
 @overload
-def min_by(selector: Callable[[T], CT]) -> Callable[[Iterable[T]], T]:
+def min_by(
+    selector: Callable[[T], CT],
+    *,
+    workers: Optional[int] = None,
+) -> Callable[[Iterable[T]], T]:
     """
     Builds a function that returns an element for which the given function returns the
     smallest value.
 
     :param selector: A function that returns a comparable value for each element.
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: Function that returns an element for which the given function returns the
     smallest value.
     """
@@ -532,18 +651,22 @@ def min_by(selector: Callable[[T], CT]) -> Callable[[Iterable[T]], T]:
 def min_by(
     selector: Callable[[T], CT],
     sequence: Optional[Iterable[T]] = None,
+    *,
+    workers: Optional[int] = None,
 ) -> Union[T, Callable[[Iterable[T]], T]]:
     """
     Returns an element for which the given function returns the smallest value.
 
     :param selector: A function that returns a comparable value for each element.
     :param sequence: The sequence. If None, a callable is returned.
+    :param workers: If set, selector is evaluated in a pool of this many worker
+    processes (at least 1). selector and the elements must be picklable.
     :return: The element that gives the smallest value from the given function.
     :raises ValueError: If the sequence is empty.
     """
     if sequence is None:
-        return lambda s: Seq(s).min_by(selector)
-    return Seq(sequence).min_by(selector)
+        return partial(_min_by, selector, workers=workers)
+    return _min_by(selector, sequence, workers)
 
 
 @overload
@@ -590,8 +713,8 @@ def min_by_or_none(
     None if the sequence is empty.
     """
     if sequence is None:
-        return lambda s: Seq(s).min_by_or_none(selector)
-    return Seq(sequence).min_by_or_none(selector)
+        return partial(iter_utils.min_by_or_none, selector=selector)
+    return iter_utils.min_by_or_none(sequence, selector)
 
 
 def single(sequence: Iterable[T]) -> T:
@@ -602,7 +725,7 @@ def single(sequence: Iterable[T]) -> T:
     :return: The single element of the sequence.
     :raises ValueError: If the sequence is empty or contains more than one element.
     """
-    return Seq(sequence).single()
+    return iter_utils.single(sequence)
 
 
 def single_or_none(sequence: Iterable[T]) -> Optional[T]:
@@ -614,7 +737,7 @@ def single_or_none(sequence: Iterable[T]) -> Optional[T]:
     :return: The single element of the sequence or None if the sequence is empty or
     contains more than one element.
     """
-    return Seq(sequence).single_or_none()
+    return iter_utils.single_or_none(sequence)
 
 
 def first(sequence: Iterable[T]) -> T:
@@ -625,7 +748,7 @@ def first(sequence: Iterable[T]) -> T:
     :return: The first element of the sequence.
     :raises ValueError: If the sequence is empty.
     """
-    return Seq(sequence).first()
+    return iter_utils.first(sequence)
 
 
 def first_or_none(sequence: Iterable[T]) -> Optional[T]:
@@ -635,7 +758,7 @@ def first_or_none(sequence: Iterable[T]) -> Optional[T]:
     :param sequence: The sequence
     :return: The first element of the sequence or None if the sequence is empty.
     """
-    return Seq(sequence).first_or_none()
+    return iter_utils.first_or_none(sequence)
 
 
 def last(sequence: Iterable[T]) -> T:
@@ -646,7 +769,10 @@ def last(sequence: Iterable[T]) -> T:
     :return: The last element of the sequence.
     :raises ValueError: If the sequence is empty.
     """
-    return Seq(sequence).last()
+    if isinstance(sequence, Seq):
+        result: T = sequence.last()
+        return result
+    return iter_utils.last(sequence)
 
 
 def last_or_none(sequence: Iterable[T]) -> Optional[T]:
@@ -656,7 +782,10 @@ def last_or_none(sequence: Iterable[T]) -> Optional[T]:
     :param sequence: The sequence
     :return: The first element of the sequence or None if the sequence is empty.
     """
-    return Seq(sequence).last_or_none()
+    if isinstance(sequence, Seq):
+        result: Optional[T] = sequence.last_or_none()
+        return result
+    return iter_utils.last_or_none(sequence)
 
 
 @overload
@@ -706,8 +835,8 @@ def reduce_or_none(
     :return: The accumulated value, or None if the sequence is empty.
     """
     if sequence is None:
-        return lambda s: Seq(s).reduce_or_none(operation)
-    return Seq(sequence).reduce_or_none(operation)
+        return partial(iter_utils.reduce_or_none, operation=operation)
+    return iter_utils.reduce_or_none(sequence, operation)
 
 
 def sum_or_none(sequence: Iterable[AT]) -> Optional[AT]:
@@ -718,13 +847,65 @@ def sum_or_none(sequence: Iterable[AT]) -> Optional[AT]:
     :param sequence: The sequence
     :return: The sum of the sequence elements, or None if the sequence is empty.
     """
-    return Seq(sequence).sum_or_none()
+    return iter_utils.reduce_or_none(sequence, operator.add)
+
+
+def _join_to_string(
+    separator: str,
+    prefix: str,
+    suffix: str,
+    transform: Callable[[T], str],
+    sequence: Iterable[T],
+) -> str:
+    return f"{prefix}{separator.join(map(transform, sequence))}{suffix}"
+
+
+@overload
+def join_to_string(
+    separator: str = ", ",
+    prefix: str = "",
+    suffix: str = "",
+) -> Callable[[Iterable[T]], str]:
+    """
+    Builds a function that concatenates elements of the sequence into a single string
+    with specified separators, prefix, and suffix.
+
+    :param separator: The separator string to use between each element.
+    :param prefix: The prefix string to add at the beginning.
+    :param suffix: The suffix string to add at the end.
+    :return: Function that concatenates elements of the sequence into a single string
+    with specified separators, prefix, and suffix.
+    """
+
+
+@overload
+def join_to_string(
+    separator: str = ", ",
+    prefix: str = "",
+    suffix: str = "",
+    *,
+    transform: Callable[[T], str],
+) -> Callable[[Iterable[T]], str]:
+    """
+    Builds a function that converts elements of the sequence with transform and
+    concatenates them into a single string with specified separators, prefix, and
+    suffix.
+
+    :param separator: The separator string to use between each element.
+    :param prefix: The prefix string to add at the beginning.
+    :param suffix: The suffix string to add at the end.
+    :param transform: A function that converts each element into a string.
+    :return: Function that concatenates elements of the sequence into a single string
+    with specified separators, prefix, and suffix.
+    """
 
 
 def join_to_string(
     separator: str = ", ",
     prefix: str = "",
     suffix: str = "",
+    *,
+    transform: Callable[[T], str] = str,
 ) -> Callable[[Iterable[T]], str]:
     """
     Builds a function that concatenates elements of the sequence into a single string
@@ -733,11 +914,8 @@ def join_to_string(
     :param separator: The separator string to use between each element.
     :param prefix: The prefix string to add at the beginning.
     :param suffix: The suffix string to add at the end.
+    :param transform: A function that converts each element into a string.
     :return: Function that concatenates elements of the sequence into a single string
     with specified separators, prefix, and suffix.
     """
-    return lambda s: Seq(s).join_to_string(
-        separator=separator,
-        prefix=prefix,
-        suffix=suffix,
-    )
+    return partial(_join_to_string, separator, prefix, suffix, transform)
@@ -1,6 +1,7 @@
 """kothon sequence functions"""
 
-from typing import Iterable, Optional, TypeVar, Type, Callable, overload, Union
+from functools import partial
+from typing import Any, Iterable, Optional, TypeVar, Type, Callable, overload, Union
 
 from .._utils.type_utils import CT
 from ..iterable.seq import Seq
@@ -9,6 +10,14 @@ T = TypeVar("T")
 R = TypeVar("R")
 
 
+def _call(
+    method: Callable[[Seq[T], Any], R],
+    argument: Any,
+    sequence: Iterable[T],
+) -> R:
+    return method(Seq(sequence), argument)
+
+
 def kothon_filter(predicate: Callable[[T], bool]) -> Callable[[Iterable[T]], Seq[T]]:
     """
     Builds a function that filters elements in the sequence based on a predicate.
@@ -16,7 +25,7 @@ def kothon_filter(predicate: Callable[[T], bool]) -> Callable[[Iterable[T]], Seq
     :param predicate: A function that evaluates each element to a boolean.
     :return: Function that filters elements in the sequence based on a predicate.
     """
-    return lambda s: Seq(filter(predicate, s))
+    return partial(_call, Seq.filter, predicate)
 
 
 def filter_not_none(sequence: Iterable[Optional[T]]) -> Seq[T]:
@@ -65,7 +74,7 @@ def filter_is_instance(
     :return: A new Seq instance containing only elements of the specified type.
     """
     if sequence is None:
-        return lambda s: Seq(s).filter_is_instance(cls)
+        return partial(_call, Seq.filter_is_instance, cls)
     return Seq(sequence).filter_is_instance(cls)
 
 
@@ -79,7 +88,7 @@ def kothon_map(fn: Callable[[T], R]) -> Callable[[Iterable[T]], Seq[R]]:
     :return: Function that transforms each element in the sequence using a given
     function fn.
     """
-    return lambda s: Seq(map(fn, s))
+    return partial(_call, Seq.map, fn)
 
 
 @overload
@@ -132,7 +141,7 @@ def map_not_none(
     results.
     """
     if sequence is None:
-        return lambda s: Seq(s).map_not_none(fn)
+        return partial(_call, Seq.map_not_none, fn)
     return Seq(sequence).map_not_none(fn)
 
 
@@ -181,7 +190,7 @@ def flat_map(
     produced by applying the function to each element in the original sequence.
     """
     if sequence is None:
-        return lambda s: Seq(s).flat_map(fn)
+        return partial(_call, Seq.flat_map, fn)
     return Seq(sequence).flat_map(fn)
 
 
@@ -236,7 +245,7 @@ def drop(
     :return: A new Seq instance with the first n elements dropped.
     """
     if sequence is None:
-        return lambda s: Seq(s).drop(n)
+        return partial(_call, Seq.drop, n)
     return Seq(sequence).drop(n)
 
 
@@ -282,7 +291,7 @@ def drop_while(
     is true.
     """
     if sequence is None:
-        return lambda s: Seq(s).drop_while(predicate)
+        return partial(_call, Seq.drop_while, predicate)
     return Seq(sequence).drop_while(predicate)
 
 
@@ -324,7 +333,7 @@ def take(
     :return: A new Seq instance with at most n elements.
     """
     if sequence is None:
-        return lambda s: Seq(s).take(n)
+        return partial(_call, Seq.take, n)
     return Seq(sequence).take(n)
 
 
@@ -370,7 +379,7 @@ def take_while(
     :return: A new Seq instance with elements as long as the predicate is true.
     """
     if sequence is None:
-        return lambda s: Seq(s).take_while(predicate)
+        return partial(_call, Seq.take_while, predicate)
     return Seq(sequence).take_while(predicate)
 
 
@@ -412,7 +421,7 @@ def sorted_by(
     :return: A new Seq instance with elements sorted by the key function.
     """
     if sequence is None:
-        return lambda s: Seq(s).sorted_by(key_func)
+        return partial(_call, Seq.sorted_by, key_func)
     return Seq(sequence).sorted_by(key_func)
 
 
@@ -468,7 +477,7 @@ def sorted_by_desc(
     descending order.
     """
     if sequence is None:
-        return lambda s: Seq(s).sorted_by_desc(key_func)
+        return partial(_call, Seq.sorted_by_desc, key_func)
     return Seq(sequence).sorted_by_desc(key_func)
 
 
@@ -510,7 +519,7 @@ def chunked(
     the original sequence.
     """
     if sequence is None:
-        return lambda s: Seq(s).chunked(size)
+        return partial(_call, Seq.chunked, size)
     return Seq(sequence).chunked(size)
 
 
@@ -566,7 +575,7 @@ def distinct_by(
     :return: A new Seq instance with distinct elements based on the key.
     """
     if sequence is None:
-        return lambda s: Seq(s).distinct_by(key_selector)
+        return partial(_call, Seq.distinct_by, key_selector)
     return Seq(sequence).distinct_by(key_selector)
 
 
@@ -612,5 +621,5 @@ def partition(
     predicate is False.
     """
     if sequence is None:
-        return lambda s: Seq(s).partition(predicate)
+        return partial(_call, Seq.partition, predicate)
     return Seq(sequence).partition(predicate)
@@ -5,12 +5,16 @@ lazy-evaluation mechanism for efficiently chaining operations such as mapping,
 filtering, and reducing sequences.
 """
 
-import functools
 import operator
 import random
-from itertools import islice
+import sys
+from itertools import dropwhile, islice, takewhile
 from typing import Generic, Iterator, TypeVar, Iterable, Callable, Optional, Type
 
+if sys.version_info >= (3, 12):
+    from itertools import batched
+
+from .._utils import iter_utils
 from .._utils.type_utils import CT, AT
 
 T = TypeVar("T")
@@ -27,6 +31,8 @@ class Seq(Generic[T]):
     operations without creating intermediate collections.
     """
 
+    __slots__ = ("_iterable", "__weakref__")
+
     _iterable: Iterable[T]
 
     def __init__(self, iterable: Iterable[T]):
@@ -118,7 +124,7 @@ class Seq(Generic[T]):
         :return: A dictionary containing the key-value pairs resulting from the
         transformation of each element in the sequence.
         """
-        return dict(fn(d) for d in self)
+        return dict(map(fn, self))
 
     def associate_by(self, key_selector: Callable[[T], Key]) -> dict[Key, T]:
         """
@@ -130,7 +136,7 @@ class Seq(Generic[T]):
         :return: A dictionary where each key is the result of applying the key selector
         function to each element, and each value is the element itself.
         """
-        return dict((key_selector(d), d) for d in self)
+        return {key_selector(d): d for d in self}
 
     def associate_with(self, value_selector: Callable[[T], Value]) -> dict[T, Value]:
         """
@@ -142,7 +148,7 @@ class Seq(Generic[T]):
         :return: A dictionary where each key is an element from the sequence, and each
         value is the result of applying the value selector function to that element.
         """
-        return dict((d, value_selector(d)) for d in self)
+        return {d: value_selector(d) for d in self}
 
     def group_by(self, key_selector: Callable[[T], Key]) -> dict[Key, list[T]]:
         """
@@ -156,10 +162,7 @@ class Seq(Generic[T]):
         function to the elements, and each value is a list of elements that share the
         same key.
         """
-        result: dict[Key, list[T]] = {}
-        for d in self:
-            result.setdefault(key_selector(d), []).append(d)
-        return result
+        return iter_utils.group_by(self._iterable, key_selector)
 
     def to_list(self) -> list[T]:
         """
@@ -167,7 +170,7 @@ class Seq(Generic[T]):
 
         :return: A list containing all elements of the sequence.
         """
-        return list(self)
+        return list(self._iterable)
 
     def to_set(self) -> set[T]:
         """
@@ -175,7 +178,7 @@ class Seq(Generic[T]):
 
         :return: A set containing all elements of the sequence.
         """
-        return set(self)
+        return set(self._iterable)
 
     def to_frozenset(self) -> frozenset[T]:
         """
@@ -183,7 +186,7 @@ class Seq(Generic[T]):
 
         :return: A set containing all elements of the sequence.
         """
-        return frozenset(self)
+        return frozenset(self._iterable)
 
     def all(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
         """
@@ -195,7 +198,7 @@ class Seq(Generic[T]):
         """
         if predicate is None:
             return all(self)
-        return all(predicate(d) for d in self)
+        return iter_utils.all_match(self._iterable, predicate)
 
     def none(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
         """
@@ -217,7 +220,7 @@ class Seq(Generic[T]):
         """
         if predicate is None:
             return any(self)
-        return any(predicate(d) for d in self)
+        return iter_utils.any_match(self._iterable, predicate)
 
     def max(self: "Seq[CT]") -> CT:
         """
@@ -255,12 +258,7 @@ class Seq(Generic[T]):
         :return: The element that gives the maximum value from the given function or
         None if the sequence is empty.
         """
-        result: Optional[tuple[CT, T]] = Seq(
-            (selector(v), v) for v in self
-        ).reduce_or_none(lambda x, y: x if x[0] > y[0] else y)
-        if result is not None:
-            return result[1]
-        return None
+        return iter_utils.max_by_or_none(self._iterable, selector)
 
     def min(self: "Seq[CT]") -> CT:
         """
@@ -298,12 +296,7 @@ class Seq(Generic[T]):
         :return: The element that gives the smallest value from the given function or
         None if the sequence is empty.
         """
-        result: Optional[tuple[CT, T]] = Seq(
-            (selector(v), v) for v in self
-        ).reduce_or_none(lambda x, y: x if x[0] < y[0] else y)
-        if result is not None:
-            return result[1]
-        return None
+        return iter_utils.min_by_or_none(self._iterable, selector)
 
     def single(self) -> T:
         """
@@ -312,17 +305,7 @@ class Seq(Generic[T]):
         :return: The single element of the sequence.
         :raises ValueError: If the sequence is empty or contains more than one element.
         """
-        it = iter(self)
-        try:
-            value = next(it)
-        except StopIteration:
-            # pylint: disable=raise-missing-from
-            raise ValueError("single() called on an empty sequence")
-        try:
-            next(it)
-            raise ValueError("single() called on a sequence with more than one element")
-        except StopIteration:
-            return value
+        return iter_utils.single(self._iterable)
 
     def single_or_none(self) -> Optional[T]:
         """
@@ -332,16 +315,7 @@ class Seq(Generic[T]):
         :return: The single element of the sequence or None if the sequence is empty or
         contains more than one element.
         """
-        it = iter(self)
-        try:
-            value = next(it)
-        except StopIteration:
-            return None
-        try:
-            next(it)
-            return None
-        except StopIteration:
-            return value
+        return iter_utils.single_or_none(self._iterable)
 
     def first(self) -> T:
         """
@@ -350,11 +324,7 @@ class Seq(Generic[T]):
         :return: The first element of the sequence.
         :raises ValueError: If the sequence is empty.
         """
-        try:
-            return next(iter(self))
-        except StopIteration:
-            # pylint: disable=raise-missing-from
-            raise ValueError("first() called on an empty sequence")
+        return iter_utils.first(self._iterable)
 
     def first_or_none(self) -> Optional[T]:
         """
@@ -362,7 +332,7 @@ class Seq(Generic[T]):
 
         :return: The first element of the sequence or None if the sequence is empty.
         """
-        return next(iter(self), None)
+        return iter_utils.first_or_none(self._iterable)
 
     def last(self) -> T:
         """
@@ -371,21 +341,7 @@ class Seq(Generic[T]):
         :return: The last element of the sequence.
         :raises ValueError: If the sequence is empty.
         """
-        if isinstance(self._iterable, (list, tuple, str)):
-            if len(self._iterable) == 0:
-                raise ValueError("last() called on an empty sequence")
-            result: T = self._iterable[-1]
-            return result
-
-        it = iter(self)
-        try:
-            last_value = next(it)
-        except StopIteration:
-            # pylint: disable=raise-missing-from
-            raise ValueError("last() called on an empty sequence")
-        for x in it:
-            last_value = x
-        return last_value
+        return iter_utils.last(self._iterable)
 
     def last_or_none(self) -> Optional[T]:
         """
@@ -393,16 +349,7 @@ class Seq(Generic[T]):
 
         :return: The first element of the sequence or None if the sequence is empty.
         """
-        if isinstance(self._iterable, (list, tuple, str)):
-            if len(self._iterable) == 0:
-                return None
-            result: T = self._iterable[-1]
-            return result
-
-        last_value = None
-        for x in self:
-            last_value = x
-        return last_value
+        return iter_utils.last_or_none(self._iterable)
 
     def drop(self, n: int) -> "Seq[T]":
         """
@@ -411,7 +358,7 @@ class Seq(Generic[T]):
         :param n: The number of elements to skip.
         :return: A new Seq instance with the first n elements dropped.
         """
-        return Seq(x for i, x in enumerate(self) if i >= n)
+        return Seq(islice(self, min(max(n, 0), sys.maxsize), None))
 
     def drop_while(self, predicate: Callable[[T], bool]) -> "Seq[T]":
         """
@@ -421,16 +368,7 @@ class Seq(Generic[T]):
         :return: A new Seq instance with the elements dropped as long as the predicate
         is true.
         """
-
-        def generator() -> Iterable[T]:
-            iterator = iter(self)
-            for element in iterator:
-                if not predicate(element):
-                    yield element
-                    break
-            yield from iterator
-
-        return Seq(generator())
+        return Seq(dropwhile(predicate, self))
 
     def take(self, n: int) -> "Seq[T]":
         """
@@ -439,7 +377,7 @@ class Seq(Generic[T]):
         :param n: The number of elements to take.
         :return: A new Seq instance with at most n elements.
         """
-        return Seq(item for i, item in enumerate(self) if i < n)
+        return Seq(islice(self, min(max(n, 0), sys.maxsize)))
 
     def take_while(self, predicate: Callable[[T], bool]) -> "Seq[T]":
         """
@@ -449,15 +387,7 @@ class Seq(Generic[T]):
         :param predicate: A function that evaluates each element to a boolean.
         :return: A new Seq instance with elements as long as the predicate is true.
         """
-
-        def generator() -> Iterable[T]:
-            for element in self:
-                if predicate(element):
-                    yield element
-                else:
-                    break
-
-        return Seq(generator())
+        return Seq(takewhile(predicate, self))
 
     def sorted(self: "Seq[CT]") -> "Seq[CT]":
         """
@@ -465,7 +395,7 @@ class Seq(Generic[T]):
 
         :return: A new Seq instance with sorted elements.
         """
-        return Seq(sorted(self))
+        return Seq(sorted(self._iterable))
 
     def sorted_by(self, key_func: Callable[[T], CT]) -> "Seq[T]":
         """
@@ -474,7 +404,7 @@ class Seq(Generic[T]):
         :param key_func: A function that extracts a comparison key from each element.
         :return: A new Seq instance with elements sorted by the key function.
         """
-        return Seq(sorted(self, key=key_func))
+        return Seq(sorted(self._iterable, key=key_func))
 
     def sorted_desc(self: "Seq[CT]") -> "Seq[CT]":
         """
@@ -482,18 +412,19 @@ class Seq(Generic[T]):
 
         :return: A new Seq instance with elements sorted in descending order.
         """
-        return Seq(sorted(self, reverse=True))
+        return Seq(sorted(self._iterable, reverse=True))
 
     def sorted_by_desc(self, key_func: Callable[[T], CT]) -> "Seq[T]":
         """
         Returns a new Seq with elements sorted in descending order according to the
-        specified key function.
+        specified key function. The sort is stable: elements with equal keys keep
+        their original order, so there is no need to negate numeric keys.
 
         :param key_func: A function that extracts a comparison key from each element.
         :return: A new Seq instance with elements sorted by the key function in
         descending order.
         """
-        return Seq(sorted(self, key=key_func, reverse=True))
+        return Seq(sorted(self._iterable, key=key_func, reverse=True))
 
     def chunked(self, size: int) -> "Seq[list[T]]":
         """
@@ -506,15 +437,11 @@ class Seq(Generic[T]):
         if size < 1:
             raise ValueError("size must be greater than 0")
 
-        def generator() -> Iterable[list[T]]:
-            it = iter(self)
-            while True:
-                chunk = list(islice(it, size))
-                if not chunk:
-                    break
-                yield chunk
+        if sys.version_info >= (3, 12):
+            return Seq(map(list, batched(self, size)))
 
-        return Seq(generator())
+        it = iter(self)
+        return Seq(iter(lambda: list(islice(it, size)), []))
 
     def enumerate(self) -> "Seq[tuple[int, T]]":
         """
@@ -526,7 +453,9 @@ class Seq(Generic[T]):
 
     def shuffled(self, rng: Optional[random.Random] = None) -> "Seq[T]":
         """
-        Returns a new Seq with elements shuffled in random order.
+        Returns a new Seq with elements shuffled in random order. The elements are
+        copied into a new list that is shuffled in place, so the source is never
+        modified.
 
         :param rng: An optional instance of random.Random for deterministic shuffling.
         If not provided, the default random generator is used, which is not
@@ -551,7 +480,7 @@ class Seq(Generic[T]):
         :return: The accumulated value.
         :raises TypeError: If the sequence is empty.
         """
-        return functools.reduce(operation, self)
+        return iter_utils.reduce(self._iterable, operation)
 
     def reduce_or_none(self, operation: Callable[[T, T], T]) -> Optional[T]:
         """
@@ -562,14 +491,7 @@ class Seq(Generic[T]):
         element) and returns a new accumulator value.
         :return: The accumulated value, or None if the sequence is empty.
         """
-        it = iter(self)
-        try:
-            accumulator: T = next(it)
-        except StopIteration:
-            return None
-        for element in it:
-            accumulator = operation(accumulator, element)
-        return accumulator
+        return iter_utils.reduce_or_none(self._iterable, operation)
 
     def sum(self: "Seq[AT]") -> AT:
         """
@@ -596,14 +518,8 @@ class Seq(Generic[T]):
         :return: A new Seq instance with unique elements.
         """
         seen: set[T] = set()
-
-        def check_key(key: T) -> bool:
-            if key in seen:
-                return False
-            seen.add(key)
-            return True
-
-        return Seq(x for x in self if check_key(x))
+        mark_seen = seen.add
+        return Seq(x for x in self if not (x in seen or mark_seen(x)))
 
     def distinct_by(self, key_selector: Callable[[T], R]) -> "Seq[T]":
         """
@@ -614,14 +530,10 @@ class Seq(Generic[T]):
         :return: A new Seq instance with distinct elements based on the key.
         """
         seen: set[R] = set()
-
-        def check_key(key: R) -> bool:
-            if key in seen:
-                return False
-            seen.add(key)
-            return True
-
-        return Seq(e for e in self if check_key(key_selector(e)))
+        mark_seen = seen.add
+        return Seq(
+            e for e in self if not ((key := key_selector(e)) in seen or mark_seen(key))
+        )
 
     def for_each(self, action: Callable[[T], None]) -> None:
         """
@@ -637,6 +549,8 @@ class Seq(Generic[T]):
         separator: str = ", ",
         prefix: str = "",
         suffix: str = "",
+        *,
+        transform: Callable[[T], str] = str,
     ) -> str:
         """
         Concatenates elements of the sequence into a single string with specified
@@ -645,9 +559,10 @@ class Seq(Generic[T]):
         :param separator: The separator string to use between each element.
         :param prefix: The prefix string to add at the beginning.
         :param suffix: The suffix string to add at the end.
+        :param transform: A function that converts each element into a string.
         :return: A string representation of the sequence elements.
         """
-        return prefix + separator.join(str(e) for e in self) + suffix
+        return f"{prefix}{separator.join(map(transform, self))}{suffix}"
 
     def partition(self, predicate: Callable[[T], bool]) -> tuple[list[T], list[T]]:
         """
@@ -658,10 +573,9 @@ class Seq(Generic[T]):
         the predicate is True, and the second containing elements for which the
         predicate is False.
         """
-        true_seq, false_seq = [], []
+        true_seq: list[T] = []
+        false_seq: list[T] = []
+        append_true, append_false = true_seq.append, false_seq.append
         for element in self:
-            if predicate(element):
-                true_seq.append(element)
-            else:
-                false_seq.append(element)
+            (append_true if predicate(element) else append_false)(element)
         return true_seq, false_seq
@@ -1,8 +1,11 @@
 # pylint: disable=missing-module-docstring,missing-function-docstring
 
+import array
 import functools
+import itertools
 import operator
 import random
+import weakref
 from typing import cast, Callable, Optional, Iterable
 
 import pytest
@@ -55,6 +58,12 @@ from kothon import (
 )
 
 
+def test_slots() -> None:
+    seq = Seq([1, 2, 3])
+    assert not hasattr(seq, "__dict__")
+    assert weakref.ref(seq)() is seq
+
+
 def test_filter() -> None:
     seq = Seq([1, 2, 3, 4, 5])
     fun: Callable[[int], bool] = lambda x: x % 2 == 0
@@ -107,6 +116,12 @@ def test_flat_map() -> None:
     _3: list[str] = flat_map(fun)(seq).to_list()  # type: ignore[assignment]
     assert r1 == r2 == r3 == [1, 10, 2, 20, 3, 30]
 
+    fun2: Callable[[int], tuple[int, int]] = lambda x: (x, x * 10)
+    r1 = seq.flat_map(fun2).to_list()
+    r2 = flat_map(fun2, seq).to_list()
+    r3 = flat_map(fun2)(seq).to_list()
+    assert r1 == r2 == r3 == [1, 10, 2, 20, 3, 30]
+
 
 def test_flatten() -> None:
     seq: Seq[Iterable[int]] = Seq([[1, 2], [3, 4], [5]])
@@ -139,6 +154,9 @@ def test_associate_by() -> None:
     r3: dict[str, str] = associate_by(fun)(seq)
     _3: dict[str, int] = associate_by(fun)(seq)  # type: ignore[assignment]
     assert r1 == r2 == r3 == {"a": "apple", "b": "banana", "c": "cherry"}
+    expected = {"a": "apple", "b": "banana"}
+    assert associate_by(fun, iter(expected.values())) == expected
+    assert Seq(iter(expected.values())).associate_by(fun) == expected
 
 
 def test_associate_with() -> None:
@@ -151,6 +169,8 @@ def test_associate_with() -> None:
     r3: dict[int, int] = associate_with(fun)(seq)
     _3: dict[int, str] = associate_with(fun)(seq)  # type: ignore[assignment]
     assert r1 == r2 == r3 == {1: 1, 2: 4, 3: 9}
+    assert associate_with(fun, iter([1, 2, 3])) == {1: 1, 2: 4, 3: 9}
+    assert Seq(iter([1, 2, 3])).associate_with(fun) == {1: 1, 2: 4, 3: 9}
 
 
 def test_group_by() -> None:
@@ -163,6 +183,27 @@ def test_group_by() -> None:
     r3: dict[int, list[str]] = group_by(fun)(seq)
     _3: dict[int, list[int]] = group_by(fun)(seq)  # type: ignore[assignment]
     assert r1 == r2 == r3 == {3: ["one", "two"], 5: ["three"]}
+    assert group_by(fun)(iter(seq)) == {3: ["one", "two"], 5: ["three"]}
+
+
+def test_workers() -> None:
+    seq = ["one", "two", "three", "four"]
+    assert associate_by(len, seq, workers=2) == associate_by(len)(seq)
+    assert associate_by(len, workers=2)(seq) == {3: "two", 5: "three", 4: "four"}
+    assert group_by(len, seq, workers=2) == group_by(len)(seq)
+    assert group_by(len, workers=2)(seq) == {
+        3: ["one", "two"],
+        5: ["three"],
+        4: ["four"],
+    }
+    assert max_by(len, seq, workers=2) == max_by(len, workers=2)(seq) == "three"
+    assert min_by(len, seq, workers=2) == min_by(len, workers=2)(seq) == "one"
+    with pytest.raises(ValueError):
+        max_by(len, [], workers=2)
+    with pytest.raises(ValueError):
+        group_by(len, seq, workers=0)
+    with pytest.raises(ValueError):
+        associate_by(len, workers=-1)(seq)
 
 
 def test_to_list() -> None:
@@ -174,6 +215,9 @@ def test_to_list() -> None:
     r3: list[int] = to_list(seq)
     _3: list[str] = to_list(seq)  # type: ignore[arg-type]
     assert r1 == r2 == r3 == [1, 2, 3]
+    data = [1, 2, 3]
+    assert to_list(Seq(data)) is not data
+    assert Seq(data).to_list() is not data
 
 
 def test_to_set() -> None:
@@ -185,6 +229,7 @@ def test_to_set() -> None:
     r3: set[int] = to_set(seq)
     _3: set[str] = to_set(seq)  # type: ignore[arg-type]
     assert r1 == r2 == r3 == {1, 2, 3}
+    assert to_set([1, 2, 2]) == {1, 2}
 
 
 def test_to_frozenset() -> None:
@@ -196,6 +241,7 @@ def test_to_frozenset() -> None:
     r3: frozenset[int] = to_frozenset(seq)
     _3: frozenset[str] = to_frozenset(seq)  # type: ignore[arg-type]
     assert r1 == r2 == r3 == {1, 2, 3}
+    assert to_frozenset([1, 2, 2]) == {1, 2}
 
 
 def test_all() -> None:
@@ -208,6 +254,7 @@ def test_all() -> None:
     assert not all_by(lambda x: x < 3, seq)
     assert all_by(cast(Callable[[int], bool], lambda x: x < 4))(seq)
     assert not all_by(cast(Callable[[int], bool], lambda x: x < 3))(seq)
+    assert not Seq(itertools.count()).all(lambda x: x < 3)
 
 
 def test_none() -> None:
@@ -232,6 +279,7 @@ def test_any() -> None:
     assert not any_by(lambda x: x == 4, seq)
     assert any_by(lambda x: x == 2)(seq)
     assert not any_by(lambda x: x == 4)(seq)
+    assert Seq(itertools.count()).any(lambda x: x == 2)
 
 
 def test_max() -> None:
@@ -296,6 +344,9 @@ def test_max_by_or_none() -> None:
     r3 = max_by_or_none(fun)(seq)
     assert r1 == r2 == r3 == "abc"
 
+    seq = Seq(["ab", "cd"])
+    assert seq.max_by_or_none(fun) == seq.max_by(fun) == "ab"
+
 
 def test_min() -> None:
     seq = Seq([3, 1, 2])
@@ -359,6 +410,9 @@ def test_min_by_or_none() -> None:
     r3 = min_by_or_none(fun)(seq)
     assert r1 == r2 == r3 == "abc"
 
+    seq = Seq(["ab", "cd"])
+    assert seq.min_by_or_none(fun) == seq.min_by(fun) == "ab"
+
 
 def test_single() -> None:
     seq = Seq([5])
@@ -375,6 +429,12 @@ def test_single() -> None:
         single([1, 2])
     with pytest.raises(ValueError):
         single([])
+    assert single(range(7, 8)) == Seq(range(7, 8)).single() == 7
+    with pytest.raises(ValueError):
+        single(range(10**19))
+    with pytest.raises(ValueError):
+        Seq(range(10**19)).single()
+    assert single_or_none(range(10**19)) is None
 
 
 def test_single_or_none() -> None:
@@ -401,6 +461,13 @@ def test_first() -> None:
         Seq([]).first()
     with pytest.raises(ValueError):
         first([])
+    assert first(iter([5, 4])) == first((5, 4)) == 5
+    with pytest.raises(ValueError):
+        first(iter([]))
+    assert first(range(10**19)) == Seq(range(10**19)).first() == 0
+    assert first_or_none(range(10**19)) == 0
+    with pytest.raises(ValueError):
+        first(range(0))
 
 
 def test_first_or_none() -> None:
@@ -412,6 +479,8 @@ def test_first_or_none() -> None:
     assert r1 == r2 == 5
     assert Seq([]).first_or_none() is None
     assert first_or_none([]) is None
+    assert first_or_none(iter([5, 4])) == first_or_none((5, 4)) == 5
+    assert first_or_none(iter([])) is None
 
 
 def test_last() -> None:
@@ -435,6 +504,12 @@ def test_last() -> None:
     with pytest.raises(ValueError):
         last(range(0))
 
+    assert last(range(10**19)) == Seq(range(10**19)).last() == 10**19 - 1
+    assert Seq(array.array("q", range(1_000_000))).last() == 999_999
+    assert last(iter([1, 2, 3])) == 3
+    with pytest.raises(ValueError):
+        last(iter([]))
+
 
 def test_last_or_none() -> None:
     seq = Seq([1, 2, 3, 4, 5])
@@ -452,6 +527,8 @@ def test_last_or_none() -> None:
     assert r1 == r2 == 5
     assert Seq(range(0)).last_or_none() is None
     assert last_or_none(range(0)) is None
+    assert last_or_none(iter([1, 2, 3])) == 3
+    assert last_or_none(iter([])) is None
 
 
 def test_drop() -> None:
@@ -478,6 +555,13 @@ def test_drop() -> None:
     r3 = drop(n)(seq).to_list()
     assert not r1 and not r2 and not r3
 
+    n = -1
+    r1 = seq.drop(n).to_list()
+    r2 = drop(n, seq).to_list()
+    r3 = drop(n)(seq).to_list()
+    assert r1 == r2 == r3 == [1, 2, 3, 4, 5]
+    assert not seq.drop(2**64).to_list()
+
 
 def test_drop_while() -> None:
     seq = Seq([1, 2, 3, 4, 5, 1])
@@ -522,6 +606,13 @@ def test_take() -> None:
     r3 = take(n)(seq).to_list()
     assert r1 == r2 == r3 == [1, 2, 3, 4, 5]
 
+    n = -1
+    r1 = seq.take(n).to_list()
+    r2 = take(n, seq).to_list()
+    r3 = take(n)(seq).to_list()
+    assert not r1 and not r2 and not r3
+    assert seq.take(2**64).to_list() == [1, 2, 3, 4, 5]
+
 
 def test_take_while() -> None:
     seq = Seq([1, 2, 3, 4, 5, 1])
@@ -589,6 +680,13 @@ def test_sorted_by_desc() -> None:
     _3: list[int] = sorted_by_desc(fun)(seq).to_list()  # type: ignore[assignment]
     assert r1 == r2 == r3 == ["cherry", "damson", "apple", "banana"]
 
+    seq = Seq(["bb", "a", "cc", "b", "aa"])
+    fun2: Callable[[str], int] = len
+    r1 = seq.sorted_by_desc(fun2).to_list()
+    r2 = sorted_by_desc(fun2, seq).to_list()
+    r3 = sorted_by_desc(fun2)(seq).to_list()
+    assert r1 == r2 == r3 == ["bb", "cc", "aa", "a", "b"]
+
 
 def test_chunked() -> None:
     seq = Seq([1, 2, 3, 4, 5])
@@ -626,9 +724,10 @@ def test_shuffled() -> None:
     assert set(r1) == set(range(128))
     assert len(r1) == 128
 
-    seq = Seq([1, 2, 3, 4, 5])
-    r1 = seq.shuffled(random.Random(42)).to_list()
+    source = [1, 2, 3, 4, 5]
+    r1 = Seq(source).shuffled(random.Random(42)).to_list()
     assert r1 == [4, 2, 3, 5, 1]
+    assert source == [1, 2, 3, 4, 5]
 
 
 def test_reduce() -> None:
@@ -642,6 +741,15 @@ def test_reduce() -> None:
     with pytest.raises(TypeError):
         Seq([]).reduce(fun)
 
+    assert Seq(["a", "b", "c"]).reduce(operator.add) == "abc"
+    assert Seq([[1], [2]]).reduce(operator.add) == [1, 2]
+    assert Seq([1e100, 1.0, -1e100, 1.0]).reduce(operator.add) == 1.0
+    assert Seq([1, 1e100, 1.0, -1e100]).reduce(operator.add) == 0.0
+    assert Seq([2, 3, 4]).reduce(operator.mul) == 24
+    assert Seq([3, 1, 4]).reduce(max) == 4
+    assert Seq([3, 1, 4]).reduce(min) == 1
+    assert Seq([3, 1, 4]).reduce(operator.sub) == -2
+
 
 def test_reduce_or_none() -> None:
     seq = Seq([1, 2, 3, 4])
@@ -680,6 +788,36 @@ def test_sum_or_none() -> None:
     assert sum_or_none([]) is None
 
 
+def test_sum_ndarray() -> None:
+    np = pytest.importorskip("numpy")
+    seq = Seq(np.array([1, 2, 3, 4]))
+    assert seq.sum() == seq.sum_or_none() == sum_or_none(seq) == 10
+    assert seq.reduce(operator.add) == reduce_or_none(operator.add, seq) == 10
+    assert sum_or_none(np.array([1, 2, 3, 4])) == 10
+    assert Seq(np.array([[1, 2], [3, 4]])).sum().tolist() == [4, 6]
+    assert Seq(np.array([])).sum_or_none() is None
+    with pytest.raises(TypeError):
+        Seq(np.array([])).sum()
+    assert Seq(np.array([True, True])).sum() == np.True_
+    assert Seq(np.array([100, 100], dtype=np.int8)).sum() == np.int8(-56)
+    halves = np.ones(3000, dtype=np.float16)
+    assert Seq(halves).sum() == Seq(list(halves)).sum() == 2048.0
+    assert Seq(np.ma.array([1, 2, 3], mask=[0, 1, 0])).sum() is np.ma.masked
+
+
+def test_max_min_ndarray() -> None:
+    np = pytest.importorskip("numpy")
+    seq = Seq(np.array([3, 1, 4, 1, 5]))
+    assert seq.max() == seq.max_or_none() == max_or_none(seq) == 5
+    assert seq.min() == seq.min_or_none() == min_or_none(seq) == 1
+    assert seq.reduce(max) == reduce_or_none(max, np.array([3, 1, 4, 1, 5])) == 5
+    assert reduce_or_none(min, np.array([3, 1, 4, 1, 5])) == 1
+    assert Seq(np.array([1.0, 2.0])).max_or_none() == 2.0
+    assert Seq(np.array([1, 2])).reduce(operator.mul) == 2
+    masked = Seq(np.ma.array([3, 1, 4], mask=[1, 0, 0]))
+    assert masked.max() is masked.min() is np.ma.masked
+
+
 def test_distinct() -> None:
     seq = Seq([3, 2, 2, 1, 3, 3, 1, 3])
     r1: list[int] = seq.distinct().to_list()
@@ -735,6 +873,12 @@ def test_join_to_string() -> None:
     )(seq)
     assert r1 == r2 == "[apple, banana, cherry]"
 
+    seq2 = Seq([1, 2, 3])
+    fun: Callable[[int], str] = hex
+    r1 = seq2.join_to_string(separator="", transform=fun)
+    r2 = join_to_string(separator="", transform=fun)(seq2)
+    assert r1 == r2 == "0x10x20x3"
+
 
 def test_partition() -> None:
     seq = Seq([1, 2, 3, 4, 5])